@@ -27,6 +27,11 @@ module sudoku_cell (
 
   input wire latch_singleton,
 
+  // digit placed by this cell on latch_singleton, and digits placed by its row, column, and box peers
+  input wire propagate,
+  output wire [9:1] placed,
+  input wire [9:1] peer_mask,
+
   output wire is_singleton,
   output wire is_illegal,
   output wire solved
@@ -38,6 +43,7 @@ reg [9:1] valid;
 assign is_singleton = (valid[9]+valid[8]+valid[7]+valid[6]+valid[5]+valid[4]+valid[3]+valid[2]+valid[1]) == 1;
 assign is_illegal   = value == 0 && (valid[9]+valid[8]+valid[7]+valid[6]+valid[5]+valid[4]+valid[3]+valid[2]+valid[1]) == 0;
 assign solved = value != 0;
+assign placed = ( propagate && latch_singleton && is_singleton && value == 0 ) ? valid : 0;
 
 assign rdata = ( address == 0 ? value : valid );
 
@@ -57,6 +63,8 @@ always @(posedge clk) begin
       if ( is_singleton && value == 0 ) begin
         value <= valid;
         valid <= 0;
+      end else if ( propagate ) begin
+        valid <= valid & ~peer_mask;
       end/* else
         valid <= (value == 0) ? ~0 : 0;*/
     end
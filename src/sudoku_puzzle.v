@@ -34,6 +34,7 @@ module sudoku_puzzle (
   input wire we,
 
   input wire start_solve,
+  input wire start_check, // single pass over the values, flagging duplicates as illegal
   input wire abort,
 
   output wire busy,
@@ -42,7 +43,9 @@ module sudoku_puzzle (
   output reg illegal,
 
   // switches to disable the naked strategies, in case there are bugs
-  input wire allow_naked
+  input wire allow_naked,
+  // placed cells clear their digit from their peers, instead of waiting for an elimination pass
+  input wire allow_propagate
 );
 
 wire [8:0] values [80:0];
@@ -67,6 +70,8 @@ localparam STATE_NAKED_ITER_ROW   =  6;
 localparam STATE_NAKED_PROC1_ROW  =  7;
 localparam STATE_NAKED_PROC2_ROW  =  8;
 localparam STATE_NAKED_SAVE_ROW   =  9;
+
+localparam STATE_CHECK_ROW        = 10;
 reg [3:0] state = STATE_IDLE;
 
 assign busy = state != STATE_IDLE;
@@ -118,6 +123,7 @@ wire [8:0] row_en_c = busy ? row_en_i : row_en_decode;
 wire is_singleton;
 wire is_illegal;
 reg naked_done;
+reg conflict;
 
 reg clear_box;
 reg [3:0] phase_ct;
@@ -134,11 +140,12 @@ always @(posedge clk) begin
     we_i <= 0;
     cell_addr_i <= 0;
     naked_done <= 0;
+    conflict <= 0;
     clear_box <= 0;
     wdata_i <= 0;
     row_en_i <= 0;
   end else if ( busy ) begin // busy means 'not STATE_IDLE'
-    if ( solved || is_illegal || abort ) begin // abort if we ever hit solved or abort (stuck will exit when encountered)
+    if ( abort || (state != STATE_CHECK_ROW && (solved || is_illegal)) ) begin // abort if we ever hit solved or abort (stuck will exit when encountered)
       latch_singleton <= 0;
       we_i <= 0;
       stuck <= (is_illegal ? 1 : abort);
@@ -151,7 +158,10 @@ always @(posedge clk) begin
           integer c;
 
           latch_singleton <= 0;
-          if ( is_singleton || stuck ) begin // reuse "stuck" for first iteration
+          if ( allow_propagate && is_singleton && ~stuck ) begin
+            // the cells latching now have already been eliminated from their peers, latch whatever that exposed
+            latch_singleton <= 1;
+          end else if ( is_singleton || stuck ) begin // reuse "stuck" for first iteration
             stuck <= 0;
             row_en_i <= 1;
             cell_addr_i <= 0;
@@ -324,15 +334,62 @@ always @(posedge clk) begin
             state <= STATE_NAKED_ITER_ROW;
           end
         end
+        STATE_CHECK_ROW : begin : blk_state_check_row
+          integer c;
+          reg [8:0] v;
+          reg [8:0] seen_row;
+          reg [8:0] seen_box;
+          reg [8:0] seen_col;
+          reg bad;
+
+          // valid_col/valid_box hold the digits not yet seen, as in the elimination pass
+          bad = 0;
+          seen_row = 0;
+          seen_box = 0;
+          for (c = 0; c < 9; c = c + 1) begin
+            v = rdata_c[9*(c+1)-1 -: 9];
+            if ( c % 3 == 0 )
+              seen_box = clear_box ? 0 : ~valid_box[c/3];
+            seen_col = (row_en_i == 1) ? 0 : ~valid_col[c];
+
+            if ( (v & (v - 1)) || (v & (seen_row | seen_box | seen_col)) )
+              bad = 1;
+
+            seen_row = seen_row | v;
+            seen_box = seen_box | v;
+            valid_col[c] <= ~(seen_col | v);
+            if ( c % 3 == 2 )
+              valid_box[c/3] <= ~seen_box;
+          end
+
+          conflict <= conflict | bad;
+          clear_box <= row_en_i[2] | row_en_i[5];
+          if ( row_en_i[8] ) begin
+            illegal <= conflict | bad | is_illegal;
+            row_en_i <= 0;
+            state <= STATE_IDLE;
+          end else begin
+            row_en_i <= {row_en_i[7:0],1'b0};
+          end
+        end
       endcase
     end
-  end else if ( start_solve && ~solved ) begin
+  end else if ( start_solve && (~solved || we) ) begin // solved is stale if this cycle also writes a cell
     latch_singleton <= 1;
     we_i <= 0;
     cell_addr_i <= 0;
     stuck <= 1;
     illegal <= 0;
     state <= STATE_LSINGLE;
+  end else if ( start_check ) begin
+    we_i <= 0;
+    cell_addr_i <= 0;
+    row_en_i <= 1;
+    clear_box <= 1;
+    conflict <= 0;
+    stuck <= 0;
+    illegal <= 0;
+    state <= STATE_CHECK_ROW;
   end
 end
 
@@ -372,411 +429,523 @@ assign solved = 1
       & cell_solved[17] & cell_solved[16] & cell_solved[15] & cell_solved[14] & cell_solved[13] & cell_solved[12] & cell_solved[11] & cell_solved[10] & cell_solved[9]
       & cell_solved[8] & cell_solved[7] & cell_solved[6] & cell_solved[5] & cell_solved[4] & cell_solved[3] & cell_solved[2] & cell_solved[1] & cell_solved[0];
 wire [80:0] rdata_cell [0:8];
+wire [8:0] cell_placed [80:0];
+wire [8:0] row_placed [8:0];
+wire [8:0] col_placed [8:0];
+wire [8:0] box_placed [8:0];
 sudoku_cell cell00( .clk(clk), .reset(reset),
   .rdata(rdata_cell[0][8:0]), .wdata(wdata_c[8:0]),
   .address(cell_addr), .we(row_en_c[0] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[0]), .peer_mask(row_placed[0] | col_placed[0] | box_placed[0]),
   .is_singleton(cell_singleton[0]), .is_illegal(cell_illegal[0]), .solved(cell_solved[0]) );
 sudoku_cell cell01( .clk(clk), .reset(reset),
   .rdata(rdata_cell[0][17:9]), .wdata(wdata_c[17:9]),
   .address(cell_addr), .we(row_en_c[0] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[1]), .peer_mask(row_placed[0] | col_placed[1] | box_placed[0]),
   .is_singleton(cell_singleton[1]), .is_illegal(cell_illegal[1]), .solved(cell_solved[1]) );
 sudoku_cell cell02( .clk(clk), .reset(reset),
   .rdata(rdata_cell[0][26:18]), .wdata(wdata_c[26:18]),
   .address(cell_addr), .we(row_en_c[0] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[2]), .peer_mask(row_placed[0] | col_placed[2] | box_placed[0]),
   .is_singleton(cell_singleton[2]), .is_illegal(cell_illegal[2]), .solved(cell_solved[2]) );
 sudoku_cell cell03( .clk(clk), .reset(reset),
   .rdata(rdata_cell[0][35:27]), .wdata(wdata_c[35:27]),
   .address(cell_addr), .we(row_en_c[0] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[3]), .peer_mask(row_placed[0] | col_placed[3] | box_placed[1]),
   .is_singleton(cell_singleton[3]), .is_illegal(cell_illegal[3]), .solved(cell_solved[3]) );
 sudoku_cell cell04( .clk(clk), .reset(reset),
   .rdata(rdata_cell[0][44:36]), .wdata(wdata_c[44:36]),
   .address(cell_addr), .we(row_en_c[0] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[4]), .peer_mask(row_placed[0] | col_placed[4] | box_placed[1]),
   .is_singleton(cell_singleton[4]), .is_illegal(cell_illegal[4]), .solved(cell_solved[4]) );
 sudoku_cell cell05( .clk(clk), .reset(reset),
   .rdata(rdata_cell[0][53:45]), .wdata(wdata_c[53:45]),
   .address(cell_addr), .we(row_en_c[0] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[5]), .peer_mask(row_placed[0] | col_placed[5] | box_placed[1]),
   .is_singleton(cell_singleton[5]), .is_illegal(cell_illegal[5]), .solved(cell_solved[5]) );
 sudoku_cell cell06( .clk(clk), .reset(reset),
   .rdata(rdata_cell[0][62:54]), .wdata(wdata_c[62:54]),
   .address(cell_addr), .we(row_en_c[0] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[6]), .peer_mask(row_placed[0] | col_placed[6] | box_placed[2]),
   .is_singleton(cell_singleton[6]), .is_illegal(cell_illegal[6]), .solved(cell_solved[6]) );
 sudoku_cell cell07( .clk(clk), .reset(reset),
   .rdata(rdata_cell[0][71:63]), .wdata(wdata_c[71:63]),
   .address(cell_addr), .we(row_en_c[0] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[7]), .peer_mask(row_placed[0] | col_placed[7] | box_placed[2]),
   .is_singleton(cell_singleton[7]), .is_illegal(cell_illegal[7]), .solved(cell_solved[7]) );
 sudoku_cell cell08( .clk(clk), .reset(reset),
   .rdata(rdata_cell[0][80:72]), .wdata(wdata_c[80:72]),
   .address(cell_addr), .we(row_en_c[0] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[8]), .peer_mask(row_placed[0] | col_placed[8] | box_placed[2]),
   .is_singleton(cell_singleton[8]), .is_illegal(cell_illegal[8]), .solved(cell_solved[8]) );
 sudoku_cell cell10( .clk(clk), .reset(reset),
   .rdata(rdata_cell[1][8:0]), .wdata(wdata_c[8:0]),
   .address(cell_addr), .we(row_en_c[1] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[9]), .peer_mask(row_placed[1] | col_placed[0] | box_placed[0]),
   .is_singleton(cell_singleton[9]), .is_illegal(cell_illegal[9]), .solved(cell_solved[9]) );
 sudoku_cell cell11( .clk(clk), .reset(reset),
   .rdata(rdata_cell[1][17:9]), .wdata(wdata_c[17:9]),
   .address(cell_addr), .we(row_en_c[1] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[10]), .peer_mask(row_placed[1] | col_placed[1] | box_placed[0]),
   .is_singleton(cell_singleton[10]), .is_illegal(cell_illegal[10]), .solved(cell_solved[10]) );
 sudoku_cell cell12( .clk(clk), .reset(reset),
   .rdata(rdata_cell[1][26:18]), .wdata(wdata_c[26:18]),
   .address(cell_addr), .we(row_en_c[1] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[11]), .peer_mask(row_placed[1] | col_placed[2] | box_placed[0]),
   .is_singleton(cell_singleton[11]), .is_illegal(cell_illegal[11]), .solved(cell_solved[11]) );
 sudoku_cell cell13( .clk(clk), .reset(reset),
   .rdata(rdata_cell[1][35:27]), .wdata(wdata_c[35:27]),
   .address(cell_addr), .we(row_en_c[1] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[12]), .peer_mask(row_placed[1] | col_placed[3] | box_placed[1]),
   .is_singleton(cell_singleton[12]), .is_illegal(cell_illegal[12]), .solved(cell_solved[12]) );
 sudoku_cell cell14( .clk(clk), .reset(reset),
   .rdata(rdata_cell[1][44:36]), .wdata(wdata_c[44:36]),
   .address(cell_addr), .we(row_en_c[1] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[13]), .peer_mask(row_placed[1] | col_placed[4] | box_placed[1]),
   .is_singleton(cell_singleton[13]), .is_illegal(cell_illegal[13]), .solved(cell_solved[13]) );
 sudoku_cell cell15( .clk(clk), .reset(reset),
   .rdata(rdata_cell[1][53:45]), .wdata(wdata_c[53:45]),
   .address(cell_addr), .we(row_en_c[1] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[14]), .peer_mask(row_placed[1] | col_placed[5] | box_placed[1]),
   .is_singleton(cell_singleton[14]), .is_illegal(cell_illegal[14]), .solved(cell_solved[14]) );
 sudoku_cell cell16( .clk(clk), .reset(reset),
   .rdata(rdata_cell[1][62:54]), .wdata(wdata_c[62:54]),
   .address(cell_addr), .we(row_en_c[1] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[15]), .peer_mask(row_placed[1] | col_placed[6] | box_placed[2]),
   .is_singleton(cell_singleton[15]), .is_illegal(cell_illegal[15]), .solved(cell_solved[15]) );
 sudoku_cell cell17( .clk(clk), .reset(reset),
   .rdata(rdata_cell[1][71:63]), .wdata(wdata_c[71:63]),
   .address(cell_addr), .we(row_en_c[1] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[16]), .peer_mask(row_placed[1] | col_placed[7] | box_placed[2]),
   .is_singleton(cell_singleton[16]), .is_illegal(cell_illegal[16]), .solved(cell_solved[16]) );
 sudoku_cell cell18( .clk(clk), .reset(reset),
   .rdata(rdata_cell[1][80:72]), .wdata(wdata_c[80:72]),
   .address(cell_addr), .we(row_en_c[1] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[17]), .peer_mask(row_placed[1] | col_placed[8] | box_placed[2]),
   .is_singleton(cell_singleton[17]), .is_illegal(cell_illegal[17]), .solved(cell_solved[17]) );
 sudoku_cell cell20( .clk(clk), .reset(reset),
   .rdata(rdata_cell[2][8:0]), .wdata(wdata_c[8:0]),
   .address(cell_addr), .we(row_en_c[2] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[18]), .peer_mask(row_placed[2] | col_placed[0] | box_placed[0]),
   .is_singleton(cell_singleton[18]), .is_illegal(cell_illegal[18]), .solved(cell_solved[18]) );
 sudoku_cell cell21( .clk(clk), .reset(reset),
   .rdata(rdata_cell[2][17:9]), .wdata(wdata_c[17:9]),
   .address(cell_addr), .we(row_en_c[2] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[19]), .peer_mask(row_placed[2] | col_placed[1] | box_placed[0]),
   .is_singleton(cell_singleton[19]), .is_illegal(cell_illegal[19]), .solved(cell_solved[19]) );
 sudoku_cell cell22( .clk(clk), .reset(reset),
   .rdata(rdata_cell[2][26:18]), .wdata(wdata_c[26:18]),
   .address(cell_addr), .we(row_en_c[2] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[20]), .peer_mask(row_placed[2] | col_placed[2] | box_placed[0]),
   .is_singleton(cell_singleton[20]), .is_illegal(cell_illegal[20]), .solved(cell_solved[20]) );
 sudoku_cell cell23( .clk(clk), .reset(reset),
   .rdata(rdata_cell[2][35:27]), .wdata(wdata_c[35:27]),
   .address(cell_addr), .we(row_en_c[2] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[21]), .peer_mask(row_placed[2] | col_placed[3] | box_placed[1]),
   .is_singleton(cell_singleton[21]), .is_illegal(cell_illegal[21]), .solved(cell_solved[21]) );
 sudoku_cell cell24( .clk(clk), .reset(reset),
   .rdata(rdata_cell[2][44:36]), .wdata(wdata_c[44:36]),
   .address(cell_addr), .we(row_en_c[2] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[22]), .peer_mask(row_placed[2] | col_placed[4] | box_placed[1]),
   .is_singleton(cell_singleton[22]), .is_illegal(cell_illegal[22]), .solved(cell_solved[22]) );
 sudoku_cell cell25( .clk(clk), .reset(reset),
   .rdata(rdata_cell[2][53:45]), .wdata(wdata_c[53:45]),
   .address(cell_addr), .we(row_en_c[2] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[23]), .peer_mask(row_placed[2] | col_placed[5] | box_placed[1]),
   .is_singleton(cell_singleton[23]), .is_illegal(cell_illegal[23]), .solved(cell_solved[23]) );
 sudoku_cell cell26( .clk(clk), .reset(reset),
   .rdata(rdata_cell[2][62:54]), .wdata(wdata_c[62:54]),
   .address(cell_addr), .we(row_en_c[2] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[24]), .peer_mask(row_placed[2] | col_placed[6] | box_placed[2]),
   .is_singleton(cell_singleton[24]), .is_illegal(cell_illegal[24]), .solved(cell_solved[24]) );
 sudoku_cell cell27( .clk(clk), .reset(reset),
   .rdata(rdata_cell[2][71:63]), .wdata(wdata_c[71:63]),
   .address(cell_addr), .we(row_en_c[2] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[25]), .peer_mask(row_placed[2] | col_placed[7] | box_placed[2]),
   .is_singleton(cell_singleton[25]), .is_illegal(cell_illegal[25]), .solved(cell_solved[25]) );
 sudoku_cell cell28( .clk(clk), .reset(reset),
   .rdata(rdata_cell[2][80:72]), .wdata(wdata_c[80:72]),
   .address(cell_addr), .we(row_en_c[2] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[26]), .peer_mask(row_placed[2] | col_placed[8] | box_placed[2]),
   .is_singleton(cell_singleton[26]), .is_illegal(cell_illegal[26]), .solved(cell_solved[26]) );
 sudoku_cell cell30( .clk(clk), .reset(reset),
   .rdata(rdata_cell[3][8:0]), .wdata(wdata_c[8:0]),
   .address(cell_addr), .we(row_en_c[3] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[27]), .peer_mask(row_placed[3] | col_placed[0] | box_placed[3]),
   .is_singleton(cell_singleton[27]), .is_illegal(cell_illegal[27]), .solved(cell_solved[27]) );
 sudoku_cell cell31( .clk(clk), .reset(reset),
   .rdata(rdata_cell[3][17:9]), .wdata(wdata_c[17:9]),
   .address(cell_addr), .we(row_en_c[3] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[28]), .peer_mask(row_placed[3] | col_placed[1] | box_placed[3]),
   .is_singleton(cell_singleton[28]), .is_illegal(cell_illegal[28]), .solved(cell_solved[28]) );
 sudoku_cell cell32( .clk(clk), .reset(reset),
   .rdata(rdata_cell[3][26:18]), .wdata(wdata_c[26:18]),
   .address(cell_addr), .we(row_en_c[3] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[29]), .peer_mask(row_placed[3] | col_placed[2] | box_placed[3]),
   .is_singleton(cell_singleton[29]), .is_illegal(cell_illegal[29]), .solved(cell_solved[29]) );
 sudoku_cell cell33( .clk(clk), .reset(reset),
   .rdata(rdata_cell[3][35:27]), .wdata(wdata_c[35:27]),
   .address(cell_addr), .we(row_en_c[3] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[30]), .peer_mask(row_placed[3] | col_placed[3] | box_placed[4]),
   .is_singleton(cell_singleton[30]), .is_illegal(cell_illegal[30]), .solved(cell_solved[30]) );
 sudoku_cell cell34( .clk(clk), .reset(reset),
   .rdata(rdata_cell[3][44:36]), .wdata(wdata_c[44:36]),
   .address(cell_addr), .we(row_en_c[3] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[31]), .peer_mask(row_placed[3] | col_placed[4] | box_placed[4]),
   .is_singleton(cell_singleton[31]), .is_illegal(cell_illegal[31]), .solved(cell_solved[31]) );
 sudoku_cell cell35( .clk(clk), .reset(reset),
   .rdata(rdata_cell[3][53:45]), .wdata(wdata_c[53:45]),
   .address(cell_addr), .we(row_en_c[3] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[32]), .peer_mask(row_placed[3] | col_placed[5] | box_placed[4]),
   .is_singleton(cell_singleton[32]), .is_illegal(cell_illegal[32]), .solved(cell_solved[32]) );
 sudoku_cell cell36( .clk(clk), .reset(reset),
   .rdata(rdata_cell[3][62:54]), .wdata(wdata_c[62:54]),
   .address(cell_addr), .we(row_en_c[3] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[33]), .peer_mask(row_placed[3] | col_placed[6] | box_placed[5]),
   .is_singleton(cell_singleton[33]), .is_illegal(cell_illegal[33]), .solved(cell_solved[33]) );
 sudoku_cell cell37( .clk(clk), .reset(reset),
   .rdata(rdata_cell[3][71:63]), .wdata(wdata_c[71:63]),
   .address(cell_addr), .we(row_en_c[3] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[34]), .peer_mask(row_placed[3] | col_placed[7] | box_placed[5]),
   .is_singleton(cell_singleton[34]), .is_illegal(cell_illegal[34]), .solved(cell_solved[34]) );
 sudoku_cell cell38( .clk(clk), .reset(reset),
   .rdata(rdata_cell[3][80:72]), .wdata(wdata_c[80:72]),
   .address(cell_addr), .we(row_en_c[3] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[35]), .peer_mask(row_placed[3] | col_placed[8] | box_placed[5]),
   .is_singleton(cell_singleton[35]), .is_illegal(cell_illegal[35]), .solved(cell_solved[35]) );
 sudoku_cell cell40( .clk(clk), .reset(reset),
   .rdata(rdata_cell[4][8:0]), .wdata(wdata_c[8:0]),
   .address(cell_addr), .we(row_en_c[4] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[36]), .peer_mask(row_placed[4] | col_placed[0] | box_placed[3]),
   .is_singleton(cell_singleton[36]), .is_illegal(cell_illegal[36]), .solved(cell_solved[36]) );
 sudoku_cell cell41( .clk(clk), .reset(reset),
   .rdata(rdata_cell[4][17:9]), .wdata(wdata_c[17:9]),
   .address(cell_addr), .we(row_en_c[4] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[37]), .peer_mask(row_placed[4] | col_placed[1] | box_placed[3]),
   .is_singleton(cell_singleton[37]), .is_illegal(cell_illegal[37]), .solved(cell_solved[37]) );
 sudoku_cell cell42( .clk(clk), .reset(reset),
   .rdata(rdata_cell[4][26:18]), .wdata(wdata_c[26:18]),
   .address(cell_addr), .we(row_en_c[4] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[38]), .peer_mask(row_placed[4] | col_placed[2] | box_placed[3]),
   .is_singleton(cell_singleton[38]), .is_illegal(cell_illegal[38]), .solved(cell_solved[38]) );
 sudoku_cell cell43( .clk(clk), .reset(reset),
   .rdata(rdata_cell[4][35:27]), .wdata(wdata_c[35:27]),
   .address(cell_addr), .we(row_en_c[4] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[39]), .peer_mask(row_placed[4] | col_placed[3] | box_placed[4]),
   .is_singleton(cell_singleton[39]), .is_illegal(cell_illegal[39]), .solved(cell_solved[39]) );
 sudoku_cell cell44( .clk(clk), .reset(reset),
   .rdata(rdata_cell[4][44:36]), .wdata(wdata_c[44:36]),
   .address(cell_addr), .we(row_en_c[4] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[40]), .peer_mask(row_placed[4] | col_placed[4] | box_placed[4]),
   .is_singleton(cell_singleton[40]), .is_illegal(cell_illegal[40]), .solved(cell_solved[40]) );
 sudoku_cell cell45( .clk(clk), .reset(reset),
   .rdata(rdata_cell[4][53:45]), .wdata(wdata_c[53:45]),
   .address(cell_addr), .we(row_en_c[4] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[41]), .peer_mask(row_placed[4] | col_placed[5] | box_placed[4]),
   .is_singleton(cell_singleton[41]), .is_illegal(cell_illegal[41]), .solved(cell_solved[41]) );
 sudoku_cell cell46( .clk(clk), .reset(reset),
   .rdata(rdata_cell[4][62:54]), .wdata(wdata_c[62:54]),
   .address(cell_addr), .we(row_en_c[4] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[42]), .peer_mask(row_placed[4] | col_placed[6] | box_placed[5]),
   .is_singleton(cell_singleton[42]), .is_illegal(cell_illegal[42]), .solved(cell_solved[42]) );
 sudoku_cell cell47( .clk(clk), .reset(reset),
   .rdata(rdata_cell[4][71:63]), .wdata(wdata_c[71:63]),
   .address(cell_addr), .we(row_en_c[4] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[43]), .peer_mask(row_placed[4] | col_placed[7] | box_placed[5]),
   .is_singleton(cell_singleton[43]), .is_illegal(cell_illegal[43]), .solved(cell_solved[43]) );
 sudoku_cell cell48( .clk(clk), .reset(reset),
   .rdata(rdata_cell[4][80:72]), .wdata(wdata_c[80:72]),
   .address(cell_addr), .we(row_en_c[4] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[44]), .peer_mask(row_placed[4] | col_placed[8] | box_placed[5]),
   .is_singleton(cell_singleton[44]), .is_illegal(cell_illegal[44]), .solved(cell_solved[44]) );
 sudoku_cell cell50( .clk(clk), .reset(reset),
   .rdata(rdata_cell[5][8:0]), .wdata(wdata_c[8:0]),
   .address(cell_addr), .we(row_en_c[5] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[45]), .peer_mask(row_placed[5] | col_placed[0] | box_placed[3]),
   .is_singleton(cell_singleton[45]), .is_illegal(cell_illegal[45]), .solved(cell_solved[45]) );
 sudoku_cell cell51( .clk(clk), .reset(reset),
   .rdata(rdata_cell[5][17:9]), .wdata(wdata_c[17:9]),
   .address(cell_addr), .we(row_en_c[5] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[46]), .peer_mask(row_placed[5] | col_placed[1] | box_placed[3]),
   .is_singleton(cell_singleton[46]), .is_illegal(cell_illegal[46]), .solved(cell_solved[46]) );
 sudoku_cell cell52( .clk(clk), .reset(reset),
   .rdata(rdata_cell[5][26:18]), .wdata(wdata_c[26:18]),
   .address(cell_addr), .we(row_en_c[5] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[47]), .peer_mask(row_placed[5] | col_placed[2] | box_placed[3]),
   .is_singleton(cell_singleton[47]), .is_illegal(cell_illegal[47]), .solved(cell_solved[47]) );
 sudoku_cell cell53( .clk(clk), .reset(reset),
   .rdata(rdata_cell[5][35:27]), .wdata(wdata_c[35:27]),
   .address(cell_addr), .we(row_en_c[5] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[48]), .peer_mask(row_placed[5] | col_placed[3] | box_placed[4]),
   .is_singleton(cell_singleton[48]), .is_illegal(cell_illegal[48]), .solved(cell_solved[48]) );
 sudoku_cell cell54( .clk(clk), .reset(reset),
   .rdata(rdata_cell[5][44:36]), .wdata(wdata_c[44:36]),
   .address(cell_addr), .we(row_en_c[5] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[49]), .peer_mask(row_placed[5] | col_placed[4] | box_placed[4]),
   .is_singleton(cell_singleton[49]), .is_illegal(cell_illegal[49]), .solved(cell_solved[49]) );
 sudoku_cell cell55( .clk(clk), .reset(reset),
   .rdata(rdata_cell[5][53:45]), .wdata(wdata_c[53:45]),
   .address(cell_addr), .we(row_en_c[5] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[50]), .peer_mask(row_placed[5] | col_placed[5] | box_placed[4]),
   .is_singleton(cell_singleton[50]), .is_illegal(cell_illegal[50]), .solved(cell_solved[50]) );
 sudoku_cell cell56( .clk(clk), .reset(reset),
   .rdata(rdata_cell[5][62:54]), .wdata(wdata_c[62:54]),
   .address(cell_addr), .we(row_en_c[5] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[51]), .peer_mask(row_placed[5] | col_placed[6] | box_placed[5]),
   .is_singleton(cell_singleton[51]), .is_illegal(cell_illegal[51]), .solved(cell_solved[51]) );
 sudoku_cell cell57( .clk(clk), .reset(reset),
   .rdata(rdata_cell[5][71:63]), .wdata(wdata_c[71:63]),
   .address(cell_addr), .we(row_en_c[5] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[52]), .peer_mask(row_placed[5] | col_placed[7] | box_placed[5]),
   .is_singleton(cell_singleton[52]), .is_illegal(cell_illegal[52]), .solved(cell_solved[52]) );
 sudoku_cell cell58( .clk(clk), .reset(reset),
   .rdata(rdata_cell[5][80:72]), .wdata(wdata_c[80:72]),
   .address(cell_addr), .we(row_en_c[5] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[53]), .peer_mask(row_placed[5] | col_placed[8] | box_placed[5]),
   .is_singleton(cell_singleton[53]), .is_illegal(cell_illegal[53]), .solved(cell_solved[53]) );
 sudoku_cell cell60( .clk(clk), .reset(reset),
   .rdata(rdata_cell[6][8:0]), .wdata(wdata_c[8:0]),
   .address(cell_addr), .we(row_en_c[6] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[54]), .peer_mask(row_placed[6] | col_placed[0] | box_placed[6]),
   .is_singleton(cell_singleton[54]), .is_illegal(cell_illegal[54]), .solved(cell_solved[54]) );
 sudoku_cell cell61( .clk(clk), .reset(reset),
   .rdata(rdata_cell[6][17:9]), .wdata(wdata_c[17:9]),
   .address(cell_addr), .we(row_en_c[6] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[55]), .peer_mask(row_placed[6] | col_placed[1] | box_placed[6]),
   .is_singleton(cell_singleton[55]), .is_illegal(cell_illegal[55]), .solved(cell_solved[55]) );
 sudoku_cell cell62( .clk(clk), .reset(reset),
   .rdata(rdata_cell[6][26:18]), .wdata(wdata_c[26:18]),
   .address(cell_addr), .we(row_en_c[6] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[56]), .peer_mask(row_placed[6] | col_placed[2] | box_placed[6]),
   .is_singleton(cell_singleton[56]), .is_illegal(cell_illegal[56]), .solved(cell_solved[56]) );
 sudoku_cell cell63( .clk(clk), .reset(reset),
   .rdata(rdata_cell[6][35:27]), .wdata(wdata_c[35:27]),
   .address(cell_addr), .we(row_en_c[6] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[57]), .peer_mask(row_placed[6] | col_placed[3] | box_placed[7]),
   .is_singleton(cell_singleton[57]), .is_illegal(cell_illegal[57]), .solved(cell_solved[57]) );
 sudoku_cell cell64( .clk(clk), .reset(reset),
   .rdata(rdata_cell[6][44:36]), .wdata(wdata_c[44:36]),
   .address(cell_addr), .we(row_en_c[6] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[58]), .peer_mask(row_placed[6] | col_placed[4] | box_placed[7]),
   .is_singleton(cell_singleton[58]), .is_illegal(cell_illegal[58]), .solved(cell_solved[58]) );
 sudoku_cell cell65( .clk(clk), .reset(reset),
   .rdata(rdata_cell[6][53:45]), .wdata(wdata_c[53:45]),
   .address(cell_addr), .we(row_en_c[6] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[59]), .peer_mask(row_placed[6] | col_placed[5] | box_placed[7]),
   .is_singleton(cell_singleton[59]), .is_illegal(cell_illegal[59]), .solved(cell_solved[59]) );
 sudoku_cell cell66( .clk(clk), .reset(reset),
   .rdata(rdata_cell[6][62:54]), .wdata(wdata_c[62:54]),
   .address(cell_addr), .we(row_en_c[6] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[60]), .peer_mask(row_placed[6] | col_placed[6] | box_placed[8]),
   .is_singleton(cell_singleton[60]), .is_illegal(cell_illegal[60]), .solved(cell_solved[60]) );
 sudoku_cell cell67( .clk(clk), .reset(reset),
   .rdata(rdata_cell[6][71:63]), .wdata(wdata_c[71:63]),
   .address(cell_addr), .we(row_en_c[6] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[61]), .peer_mask(row_placed[6] | col_placed[7] | box_placed[8]),
   .is_singleton(cell_singleton[61]), .is_illegal(cell_illegal[61]), .solved(cell_solved[61]) );
 sudoku_cell cell68( .clk(clk), .reset(reset),
   .rdata(rdata_cell[6][80:72]), .wdata(wdata_c[80:72]),
   .address(cell_addr), .we(row_en_c[6] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[62]), .peer_mask(row_placed[6] | col_placed[8] | box_placed[8]),
   .is_singleton(cell_singleton[62]), .is_illegal(cell_illegal[62]), .solved(cell_solved[62]) );
 sudoku_cell cell70( .clk(clk), .reset(reset),
   .rdata(rdata_cell[7][8:0]), .wdata(wdata_c[8:0]),
   .address(cell_addr), .we(row_en_c[7] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[63]), .peer_mask(row_placed[7] | col_placed[0] | box_placed[6]),
   .is_singleton(cell_singleton[63]), .is_illegal(cell_illegal[63]), .solved(cell_solved[63]) );
 sudoku_cell cell71( .clk(clk), .reset(reset),
   .rdata(rdata_cell[7][17:9]), .wdata(wdata_c[17:9]),
   .address(cell_addr), .we(row_en_c[7] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[64]), .peer_mask(row_placed[7] | col_placed[1] | box_placed[6]),
   .is_singleton(cell_singleton[64]), .is_illegal(cell_illegal[64]), .solved(cell_solved[64]) );
 sudoku_cell cell72( .clk(clk), .reset(reset),
   .rdata(rdata_cell[7][26:18]), .wdata(wdata_c[26:18]),
   .address(cell_addr), .we(row_en_c[7] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[65]), .peer_mask(row_placed[7] | col_placed[2] | box_placed[6]),
   .is_singleton(cell_singleton[65]), .is_illegal(cell_illegal[65]), .solved(cell_solved[65]) );
 sudoku_cell cell73( .clk(clk), .reset(reset),
   .rdata(rdata_cell[7][35:27]), .wdata(wdata_c[35:27]),
   .address(cell_addr), .we(row_en_c[7] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[66]), .peer_mask(row_placed[7] | col_placed[3] | box_placed[7]),
   .is_singleton(cell_singleton[66]), .is_illegal(cell_illegal[66]), .solved(cell_solved[66]) );
 sudoku_cell cell74( .clk(clk), .reset(reset),
   .rdata(rdata_cell[7][44:36]), .wdata(wdata_c[44:36]),
   .address(cell_addr), .we(row_en_c[7] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[67]), .peer_mask(row_placed[7] | col_placed[4] | box_placed[7]),
   .is_singleton(cell_singleton[67]), .is_illegal(cell_illegal[67]), .solved(cell_solved[67]) );
 sudoku_cell cell75( .clk(clk), .reset(reset),
   .rdata(rdata_cell[7][53:45]), .wdata(wdata_c[53:45]),
   .address(cell_addr), .we(row_en_c[7] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[68]), .peer_mask(row_placed[7] | col_placed[5] | box_placed[7]),
   .is_singleton(cell_singleton[68]), .is_illegal(cell_illegal[68]), .solved(cell_solved[68]) );
 sudoku_cell cell76( .clk(clk), .reset(reset),
   .rdata(rdata_cell[7][62:54]), .wdata(wdata_c[62:54]),
   .address(cell_addr), .we(row_en_c[7] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[69]), .peer_mask(row_placed[7] | col_placed[6] | box_placed[8]),
   .is_singleton(cell_singleton[69]), .is_illegal(cell_illegal[69]), .solved(cell_solved[69]) );
 sudoku_cell cell77( .clk(clk), .reset(reset),
   .rdata(rdata_cell[7][71:63]), .wdata(wdata_c[71:63]),
   .address(cell_addr), .we(row_en_c[7] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[70]), .peer_mask(row_placed[7] | col_placed[7] | box_placed[8]),
   .is_singleton(cell_singleton[70]), .is_illegal(cell_illegal[70]), .solved(cell_solved[70]) );
 sudoku_cell cell78( .clk(clk), .reset(reset),
   .rdata(rdata_cell[7][80:72]), .wdata(wdata_c[80:72]),
   .address(cell_addr), .we(row_en_c[7] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[71]), .peer_mask(row_placed[7] | col_placed[8] | box_placed[8]),
   .is_singleton(cell_singleton[71]), .is_illegal(cell_illegal[71]), .solved(cell_solved[71]) );
 sudoku_cell cell80( .clk(clk), .reset(reset),
   .rdata(rdata_cell[8][8:0]), .wdata(wdata_c[8:0]),
   .address(cell_addr), .we(row_en_c[8] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[72]), .peer_mask(row_placed[8] | col_placed[0] | box_placed[6]),
   .is_singleton(cell_singleton[72]), .is_illegal(cell_illegal[72]), .solved(cell_solved[72]) );
 sudoku_cell cell81( .clk(clk), .reset(reset),
   .rdata(rdata_cell[8][17:9]), .wdata(wdata_c[17:9]),
   .address(cell_addr), .we(row_en_c[8] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[73]), .peer_mask(row_placed[8] | col_placed[1] | box_placed[6]),
   .is_singleton(cell_singleton[73]), .is_illegal(cell_illegal[73]), .solved(cell_solved[73]) );
 sudoku_cell cell82( .clk(clk), .reset(reset),
   .rdata(rdata_cell[8][26:18]), .wdata(wdata_c[26:18]),
   .address(cell_addr), .we(row_en_c[8] & we_c[0]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[74]), .peer_mask(row_placed[8] | col_placed[2] | box_placed[6]),
   .is_singleton(cell_singleton[74]), .is_illegal(cell_illegal[74]), .solved(cell_solved[74]) );
 sudoku_cell cell83( .clk(clk), .reset(reset),
   .rdata(rdata_cell[8][35:27]), .wdata(wdata_c[35:27]),
   .address(cell_addr), .we(row_en_c[8] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[75]), .peer_mask(row_placed[8] | col_placed[3] | box_placed[7]),
   .is_singleton(cell_singleton[75]), .is_illegal(cell_illegal[75]), .solved(cell_solved[75]) );
 sudoku_cell cell84( .clk(clk), .reset(reset),
   .rdata(rdata_cell[8][44:36]), .wdata(wdata_c[44:36]),
   .address(cell_addr), .we(row_en_c[8] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[76]), .peer_mask(row_placed[8] | col_placed[4] | box_placed[7]),
   .is_singleton(cell_singleton[76]), .is_illegal(cell_illegal[76]), .solved(cell_solved[76]) );
 sudoku_cell cell85( .clk(clk), .reset(reset),
   .rdata(rdata_cell[8][53:45]), .wdata(wdata_c[53:45]),
   .address(cell_addr), .we(row_en_c[8] & we_c[1]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[77]), .peer_mask(row_placed[8] | col_placed[5] | box_placed[7]),
   .is_singleton(cell_singleton[77]), .is_illegal(cell_illegal[77]), .solved(cell_solved[77]) );
 sudoku_cell cell86( .clk(clk), .reset(reset),
   .rdata(rdata_cell[8][62:54]), .wdata(wdata_c[62:54]),
   .address(cell_addr), .we(row_en_c[8] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[78]), .peer_mask(row_placed[8] | col_placed[6] | box_placed[8]),
   .is_singleton(cell_singleton[78]), .is_illegal(cell_illegal[78]), .solved(cell_solved[78]) );
 sudoku_cell cell87( .clk(clk), .reset(reset),
   .rdata(rdata_cell[8][71:63]), .wdata(wdata_c[71:63]),
   .address(cell_addr), .we(row_en_c[8] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[79]), .peer_mask(row_placed[8] | col_placed[7] | box_placed[8]),
   .is_singleton(cell_singleton[79]), .is_illegal(cell_illegal[79]), .solved(cell_solved[79]) );
 sudoku_cell cell88( .clk(clk), .reset(reset),
   .rdata(rdata_cell[8][80:72]), .wdata(wdata_c[80:72]),
   .address(cell_addr), .we(row_en_c[8] & we_c[2]),
   .latch_singleton(latch_singleton),
+  .propagate(allow_propagate), .placed(cell_placed[80]), .peer_mask(row_placed[8] | col_placed[8] | box_placed[8]),
   .is_singleton(cell_singleton[80]), .is_illegal(cell_illegal[80]), .solved(cell_solved[80]) );
+assign row_placed[0] = cell_placed[0] | cell_placed[1] | cell_placed[2] | cell_placed[3] | cell_placed[4] | cell_placed[5] | cell_placed[6] | cell_placed[7] | cell_placed[8];
+assign row_placed[1] = cell_placed[9] | cell_placed[10] | cell_placed[11] | cell_placed[12] | cell_placed[13] | cell_placed[14] | cell_placed[15] | cell_placed[16] | cell_placed[17];
+assign row_placed[2] = cell_placed[18] | cell_placed[19] | cell_placed[20] | cell_placed[21] | cell_placed[22] | cell_placed[23] | cell_placed[24] | cell_placed[25] | cell_placed[26];
+assign row_placed[3] = cell_placed[27] | cell_placed[28] | cell_placed[29] | cell_placed[30] | cell_placed[31] | cell_placed[32] | cell_placed[33] | cell_placed[34] | cell_placed[35];
+assign row_placed[4] = cell_placed[36] | cell_placed[37] | cell_placed[38] | cell_placed[39] | cell_placed[40] | cell_placed[41] | cell_placed[42] | cell_placed[43] | cell_placed[44];
+assign row_placed[5] = cell_placed[45] | cell_placed[46] | cell_placed[47] | cell_placed[48] | cell_placed[49] | cell_placed[50] | cell_placed[51] | cell_placed[52] | cell_placed[53];
+assign row_placed[6] = cell_placed[54] | cell_placed[55] | cell_placed[56] | cell_placed[57] | cell_placed[58] | cell_placed[59] | cell_placed[60] | cell_placed[61] | cell_placed[62];
+assign row_placed[7] = cell_placed[63] | cell_placed[64] | cell_placed[65] | cell_placed[66] | cell_placed[67] | cell_placed[68] | cell_placed[69] | cell_placed[70] | cell_placed[71];
+assign row_placed[8] = cell_placed[72] | cell_placed[73] | cell_placed[74] | cell_placed[75] | cell_placed[76] | cell_placed[77] | cell_placed[78] | cell_placed[79] | cell_placed[80];
+assign col_placed[0] = cell_placed[0] | cell_placed[9] | cell_placed[18] | cell_placed[27] | cell_placed[36] | cell_placed[45] | cell_placed[54] | cell_placed[63] | cell_placed[72];
+assign col_placed[1] = cell_placed[1] | cell_placed[10] | cell_placed[19] | cell_placed[28] | cell_placed[37] | cell_placed[46] | cell_placed[55] | cell_placed[64] | cell_placed[73];
+assign col_placed[2] = cell_placed[2] | cell_placed[11] | cell_placed[20] | cell_placed[29] | cell_placed[38] | cell_placed[47] | cell_placed[56] | cell_placed[65] | cell_placed[74];
+assign col_placed[3] = cell_placed[3] | cell_placed[12] | cell_placed[21] | cell_placed[30] | cell_placed[39] | cell_placed[48] | cell_placed[57] | cell_placed[66] | cell_placed[75];
+assign col_placed[4] = cell_placed[4] | cell_placed[13] | cell_placed[22] | cell_placed[31] | cell_placed[40] | cell_placed[49] | cell_placed[58] | cell_placed[67] | cell_placed[76];
+assign col_placed[5] = cell_placed[5] | cell_placed[14] | cell_placed[23] | cell_placed[32] | cell_placed[41] | cell_placed[50] | cell_placed[59] | cell_placed[68] | cell_placed[77];
+assign col_placed[6] = cell_placed[6] | cell_placed[15] | cell_placed[24] | cell_placed[33] | cell_placed[42] | cell_placed[51] | cell_placed[60] | cell_placed[69] | cell_placed[78];
+assign col_placed[7] = cell_placed[7] | cell_placed[16] | cell_placed[25] | cell_placed[34] | cell_placed[43] | cell_placed[52] | cell_placed[61] | cell_placed[70] | cell_placed[79];
+assign col_placed[8] = cell_placed[8] | cell_placed[17] | cell_placed[26] | cell_placed[35] | cell_placed[44] | cell_placed[53] | cell_placed[62] | cell_placed[71] | cell_placed[80];
+assign box_placed[0] = cell_placed[0] | cell_placed[1] | cell_placed[2] | cell_placed[9] | cell_placed[10] | cell_placed[11] | cell_placed[18] | cell_placed[19] | cell_placed[20];
+assign box_placed[1] = cell_placed[3] | cell_placed[4] | cell_placed[5] | cell_placed[12] | cell_placed[13] | cell_placed[14] | cell_placed[21] | cell_placed[22] | cell_placed[23];
+assign box_placed[2] = cell_placed[6] | cell_placed[7] | cell_placed[8] | cell_placed[15] | cell_placed[16] | cell_placed[17] | cell_placed[24] | cell_placed[25] | cell_placed[26];
+assign box_placed[3] = cell_placed[27] | cell_placed[28] | cell_placed[29] | cell_placed[36] | cell_placed[37] | cell_placed[38] | cell_placed[45] | cell_placed[46] | cell_placed[47];
+assign box_placed[4] = cell_placed[30] | cell_placed[31] | cell_placed[32] | cell_placed[39] | cell_placed[40] | cell_placed[41] | cell_placed[48] | cell_placed[49] | cell_placed[50];
+assign box_placed[5] = cell_placed[33] | cell_placed[34] | cell_placed[35] | cell_placed[42] | cell_placed[43] | cell_placed[44] | cell_placed[51] | cell_placed[52] | cell_placed[53];
+assign box_placed[6] = cell_placed[54] | cell_placed[55] | cell_placed[56] | cell_placed[63] | cell_placed[64] | cell_placed[65] | cell_placed[72] | cell_placed[73] | cell_placed[74];
+assign box_placed[7] = cell_placed[57] | cell_placed[58] | cell_placed[59] | cell_placed[66] | cell_placed[67] | cell_placed[68] | cell_placed[75] | cell_placed[76] | cell_placed[77];
+assign box_placed[8] = cell_placed[60] | cell_placed[61] | cell_placed[62] | cell_placed[69] | cell_placed[70] | cell_placed[71] | cell_placed[78] | cell_placed[79] | cell_placed[80];
 
 endmodule
 
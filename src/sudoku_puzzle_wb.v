@@ -41,6 +41,7 @@ wire [3:0] pzl_adr_cell = wb_adr_i[7:4];
 wire       pzl_adr_type  = wb_adr_i[8];
 wire       pzl_adr_xform = wb_adr_i[9];
 wire       pzl_id = wb_adr_i[10];
+wire       pzl_adr_go = wb_adr_i[11];
 
 wire [26:0] pzl_rdata =
   pzl_id ? pzl_rdata_1 : pzl_rdata_0;
@@ -51,7 +52,8 @@ wire addr_sel   = wb_valid & (wb_adr_i & 32'h FFFF_0000) == BASE_ADR & wb_adr_i[
 
 // address decode for puzzles
 //  54321098  76543210
-// <0001?pxt><ccccaaww>
+// <0001gpxt><ccccaaww>
+// g: "go" alias, a write through it also starts the solve and enables the idle interrupt
 
 wire puzzles_sel = addr_sel & wb_adr_i[15:12] == 1;
 
@@ -99,7 +101,7 @@ assign wb_dat_o =
       4'd0,pzl_illegal[1],pzl_solved[1],pzl_stuck[1],pzl_busy[1],
       4'd0,pzl_illegal[0],pzl_solved[0],pzl_stuck[0],pzl_busy[0]
     } :
-    addr_ctrl_naked ? {30'd0,pzl_allow_naked[1],pzl_allow_naked[0]} :
+    addr_ctrl_naked ? {28'd0,pzl_allow_propagate[1],pzl_allow_propagate[0],pzl_allow_naked[1],pzl_allow_naked[0]} :
     addr_ctrl_ie    ? {16'd0,6'd0,pzl_interrupt,6'd0,pzl_ie_idle} :
       ~0);
 
@@ -116,22 +118,31 @@ wire pzl_we = puzzles_sel &
     : (wb_we_i & wb_sel_full);
 
 reg [1:0] pzl_start;
+reg [1:0] pzl_check;
 reg [1:0] pzl_abort;
 
 assign interrupt = pzl_interrupt != 0;
 // consider start to be busy to avoid possible race condition if bus is fast at enabling interrupts
-wire [1:0] pzl_interrupt = {~(pzl_busy[1]|pzl_start[1])&pzl_ie_idle[1],~(pzl_busy[0]|pzl_start[0])&pzl_ie_idle[0]};
+wire [1:0] pzl_interrupt = {
+  ~(pzl_busy[1]|pzl_start[1]|pzl_check[1])&pzl_ie_idle[1],
+  ~(pzl_busy[0]|pzl_start[0]|pzl_check[0])&pzl_ie_idle[0]
+};
 reg [1:0] pzl_allow_naked;
+reg [1:0] pzl_allow_propagate;
 reg [1:0] pzl_ie_idle;
 
 
 always @(posedge wb_clk_i) begin
   if ( wb_rst_i ) begin
     pzl_start <= 0;
+    pzl_check <= 0;
     pzl_abort <= 0;
     pzl_allow_naked <= 2'b11;
+    pzl_allow_propagate <= 2'b11;
 
     pzl_ie_idle <= 0;
+  end else if ( pzl_go != 0 ) begin
+    pzl_ie_idle <= pzl_ie_idle | pzl_go;
   end else if ( wb_we_i && addr_ctrl_ie && wb_ack_o && wb_sel_i[0] ) begin
     pzl_ie_idle <= wb_dat_i[1:0];
   end else if ( wb_we_i && addr_ctrl_status && wb_ack_o ) begin
@@ -139,20 +150,32 @@ always @(posedge wb_clk_i) begin
       pzl_start[0] <= 1;
     if ( wb_dat_i[1] && wb_sel_i[0] )
       pzl_abort[0] <= 1;
+    if ( wb_dat_i[2] && wb_sel_i[0] )
+      pzl_check[0] <= 1;
     if ( wb_dat_i[8] && wb_sel_i[1] )
       pzl_start[1] <= 1;
     if ( wb_dat_i[9] && wb_sel_i[1] )
       pzl_abort[1] <= 1;
+    if ( wb_dat_i[10] && wb_sel_i[1] )
+      pzl_check[1] <= 1;
   end else if ( wb_we_i && addr_ctrl_naked && wb_ack_o && wb_sel_i[0] ) begin
-    if ( ~pzl_busy[0] )
+    if ( ~pzl_busy[0] ) begin
       pzl_allow_naked[0] <= wb_dat_i[0];
-    if ( ~pzl_busy[1] )
+      pzl_allow_propagate[0] <= wb_dat_i[2];
+    end
+    if ( ~pzl_busy[1] ) begin
       pzl_allow_naked[1] <= wb_dat_i[1];
+      pzl_allow_propagate[1] <= wb_dat_i[3];
+    end
   end else begin
     if ( pzl_start[0] && pzl_busy[0] )
       pzl_start[0] <= 0;
     if ( pzl_start[1] && pzl_busy[1] )
       pzl_start[1] <= 0;
+    if ( pzl_check[0] && pzl_busy[0] )
+      pzl_check[0] <= 0;
+    if ( pzl_check[1] && pzl_busy[1] )
+      pzl_check[1] <= 0;
     if ( pzl_abort[0] && ~pzl_busy[0] )
       pzl_abort[0] <= 0;
     if ( pzl_abort[1] && ~pzl_busy[1] )
@@ -203,19 +226,27 @@ wire pzl_we_0 =
 wire pzl_we_1 =
     ( pzl_we & pzl_sel[1] & wb_we_i & (wb_sel_full) );
 
+// start_solve is driven directly, so the puzzle goes busy on the same edge that latches the write
+wire [1:0] pzl_go = {
+  pzl_we_1 & pzl_adr_go,
+  pzl_we_0 & pzl_adr_go
+};
+
 sudoku_puzzle puzzle0 (
   .clk(wb_clk_i), .reset(wb_rst_i),
   .wdata(pzl_wdata), .rdata(pzl_rdata_0),
   .address(pzl_addr), .we(pzl_we_0), .sel(pzl_addr_third),
 
-  .start_solve(pzl_start[0]),
+  .start_solve(pzl_start[0] | pzl_go[0]),
+  .start_check(pzl_check[0]),
   .abort(pzl_abort[0]),
   .busy(pzl_busy[0]),
   .solved(pzl_solved[0]),
   .stuck(pzl_stuck[0]),
   .illegal(pzl_illegal[0]),
 
-  .allow_naked(pzl_allow_naked[0])
+  .allow_naked(pzl_allow_naked[0]),
+  .allow_propagate(pzl_allow_propagate[0])
 );
 
 sudoku_puzzle puzzle1 (
@@ -223,14 +254,16 @@ sudoku_puzzle puzzle1 (
   .wdata(pzl_wdata), .rdata(pzl_rdata_1),
   .address(pzl_addr), .we(pzl_we_1), .sel(pzl_addr_third),
 
-  .start_solve(pzl_start[1]),
+  .start_solve(pzl_start[1] | pzl_go[1]),
+  .start_check(pzl_check[1]),
   .abort(pzl_abort[1]),
   .busy(pzl_busy[1]),
   .solved(pzl_solved[1]),
   .stuck(pzl_stuck[1]),
   .illegal(pzl_illegal[1]),
 
-  .allow_naked(pzl_allow_naked[1])
+  .allow_naked(pzl_allow_naked[1]),
+  .allow_propagate(pzl_allow_propagate[1])
 );
 
 endmodule
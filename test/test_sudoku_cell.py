@@ -36,6 +36,8 @@ async def test_sudoku_cell(dut):
     dut.we <= 0
 
     dut.latch_singleton <= 0
+    dut.propagate <= 0
+    dut.peer_mask <= 0
     await reset(dut)
 
     await ClockCycles(dut.clk, 1)
@@ -82,3 +84,35 @@ async def test_sudoku_cell(dut):
     await ClockCycles(dut.clk, 1)
     assert (dut.rdata.value == dut.value.value)
 
+    # digits placed by peers are eliminated when propagating
+    await reset(dut)
+    dut.propagate <= 1
+
+    dut.peer_mask <= 0b000000110
+    dut.latch_singleton <= 1
+    await ClockCycles(dut.clk, 1)
+    dut.latch_singleton <= 0
+    dut.peer_mask <= 0
+
+    await ClockCycles(dut.clk, 1)
+    assert (dut.valid == 0b111111001)
+    assert (not dut.solved)
+
+    dut.we <= 1
+    dut.address <= 1
+    dut.wdata <= 0b000001000
+    await ClockCycles(dut.clk, 1)
+    dut.we <= 0
+
+    # a cell placing its own digit ignores the mask, and broadcasts the digit
+    dut.peer_mask <= 0b000001000
+    dut.latch_singleton <= 1
+    await FallingEdge(dut.clk)
+    assert (dut.placed == 0b000001000)
+    await RisingEdge(dut.clk)
+    dut.latch_singleton <= 0
+    dut.peer_mask <= 0
+
+    await ClockCycles(dut.clk, 1)
+    assert (dut.value == 0b000001000)
+    assert (dut.placed == 0)
@@ -125,6 +125,25 @@ async def test_puzzle(dut,o_puzzle,s_puzzle,solvable, cycle_limit = 1000):
       assert( dut.solved == 0 and dut.stuck == 1 )
     assert( s_puzzle == f_puzzle )
 
+async def check_puzzle(dut,o_puzzle,legal):
+  await load_puzzle(dut,o_puzzle)
+
+  dut.start_check <= 1
+  await ClockCycles(dut.clk, 1)
+  dut.start_check <= 0
+
+  n = 0
+  await ClockCycles(dut.clk, 1)
+  while ( dut.busy == 1 and n < 20 ):
+    n = n + 1;
+    await ClockCycles(dut.clk, 1)
+
+  print(o_puzzle + (" legal" if legal else " illegal") + " (expected)")
+  assert( n < 20 )
+  assert( dut.stuck == 0 )
+  assert( dut.illegal == (0 if legal else 1) )
+  assert( o_puzzle == await read_puzzle(dut) )
+
 @cocotb.test()
 async def test_sudoku_puzzle(dut):
   clock = None
@@ -141,9 +160,11 @@ async def test_sudoku_puzzle(dut):
   dut.sel <= 0
   dut.we <= 0
   dut.start_solve <= 0
+  dut.start_check <= 0
   dut.abort <= 0
 
   dut.allow_naked <= 1
+  dut.allow_propagate <= 0
   await reset(dut)
 
   await test_puzzle(dut,
@@ -160,3 +181,27 @@ async def test_sudoku_puzzle(dut):
     "4...2.....35.....778.39...45.4......6.2.8.7.3......5.91...48.353.....28.....3...6",
     "469127358235864197781395624594673812612589743873412569126748935347956281958231476",1,2500)
 
+
+  # same again, with placed cells propagating to their peers
+  dut.allow_propagate <= 1
+
+  await test_puzzle(dut,
+    "5.1.6..24.6.4...73.7....1.5.....72.88.239.5473..284.9...56..4...2....31.946..17..",
+    "581763924269415873473928165694157238812396547357284691135672489728549316946831752",1,100)
+
+  await test_puzzle(dut,
+    "5.1.62.24.624...73.7....1.5.....72.88.239.5473..284.9...56..4...2....31.946..17..",
+    "5.1.62.24.624...7347..3.1.5.....72.88123965473.728469...56..48.72....31.946..17.2",0)
+  assert( dut.illegal == 1 )
+
+  await test_puzzle(dut,
+    "4...2.....35.....778.39...45.4......6.2.8.7.3......5.91...48.353.....28.....3...6",
+    "469127358235864197781395624594673812612589743873412569126748935347956281958231476",1,2500)
+
+  # validity checks, duplicated givens in a row, column, and box
+  await check_puzzle(dut,"5.1.6..24.6.4...73.7....1.5.....72.88.239.5473..284.9...56..4...2....31.946..17..",1)
+  await check_puzzle(dut,"581763924269415873473928165694157238812396547357284691135672489728549316946831752",1)
+  await check_puzzle(dut,"5.1.62.24.624...73.7....1.5.....72.88.239.5473..284.9...56..4...2....31.946..17..",0)
+  await check_puzzle(dut,"5.......................................................................5........",0)
+  await check_puzzle(dut,"5.........5......................................................................",0)
+  await check_puzzle(dut,"5...6.......7.................5..............................5...................",1)
@@ -28,7 +28,7 @@ async def reset(dut):
   await ClockCycles(dut.wb_clk_i, 5)
   dut.wb_rst_i <= 0;
 
-def load_puzzle(wbm,pid,puzzle):
+def load_puzzle(wbm,pid,puzzle,go = False):
   base_address = 0x3000_1000 | (pid<<10) | (1<<9);
 
   assert(len(puzzle) == 81)
@@ -40,6 +40,9 @@ def load_puzzle(wbm,pid,puzzle):
       val = values[row*9+sub*3] | values[row*9+sub*3+1] << 8 | values[row*9+sub*3+2] << 16;
 
       operations.append(WBOp(base_address | row<<4 | sub<<2,val,0,0b1111));
+
+  if ( go ): # write the last word through the go alias, starting the solve
+    operations[-1].adr = operations[-1].adr | 1<<11
   
   return wbm.send_cycle(operations)
 
@@ -185,3 +188,32 @@ async def test_sudoku_puzzle(dut):
 
   s_puzzle3 = await read_puzzle(wbm,0)
   print(s_puzzle3)
+
+  # load and go, the last write starts the solve and enables the idle interrupt
+  i_puzzle = "5.1.6..24.6.4...73.7....1.5.....72.88.239.5473..284.9...56..4...2....31.946..17..";
+  await load_puzzle(wbm,0,i_puzzle,True)
+  assert( (await wbm.send_cycle([WBOp(0x3000_0008)]))[0].datrd & 0b1 == 0b1 )
+
+  while ( dut.interrupt == 0 ):
+    await ClockCycles(dut.wb_clk_i, 1)
+
+  await wbm.send_cycle([WBOp(0x3000_0008,0b00)])
+
+  s_puzzle4 = await read_puzzle(wbm,0)
+  print(s_puzzle4)
+  assert(s_puzzle4 == s_puzzle)
+  assert( (await wbm.send_cycle([WBOp(0x3000_0000)]))[0].datrd  & 0b1111 == 0b0100 )
+
+  # validity check both puzzles, 0 has a duplicated 2 in the first row
+  await load_puzzle(wbm,0,"5.1.62.24.624...73.7....1.5.....72.88.239.5473..284.9...56..4...2....31.946..17..")
+  await load_puzzle(wbm,1,i_puzzle)
+  await wbm.send_cycle([WBOp(0x3000_0008,0b11),WBOp(0x3000_0000,1<<2|1<<10)])
+
+  while ( dut.interrupt == 0 ):
+    await ClockCycles(dut.wb_clk_i, 1)
+
+  while ( (await wbm.send_cycle([WBOp(0x3000_0008)]))[0].datrd & 0b1100000000 != 0b1100000000 ):
+    pass
+
+  await wbm.send_cycle([WBOp(0x3000_0008,0b00)])
+  assert( (await wbm.send_cycle([WBOp(0x3000_0000)]))[0].datrd == 0b0000_0000_1000 )
@@ -41,6 +41,10 @@ print "wire [80:0] cell_solved;\n";
 print "assign solved = $solved;\n";
 
 print "wire [80:0] rdata_cell [0:8];\n";
+print "wire [8:0] cell_placed [80:0];\n";
+print "wire [8:0] row_placed [8:0];\n";
+print "wire [8:0] col_placed [8:0];\n";
+print "wire [8:0] box_placed [8:0];\n";
 
 my @rowids;
 my @colids;
@@ -58,6 +62,15 @@ for (my $row = 0; $row < 9; ++$row) {
         "  .rdata(rdata_cell[$row][" . (9*($col+1)-1) .":" . 9*$col . "]), .wdata(wdata_c[" . (9*($col+1)-1) .":" . 9*$col . "]),\n".
         "  .address(cell_addr), .we(row_en_c[$row] & we_c[$col3]),\n". # .oe(row_en_c[$row] & oe_c),\n".
         "  .latch_singleton(latch_singleton),\n".
+        "  .propagate(allow_propagate), .placed(cell_placed[$idx]), .peer_mask(row_placed[$row] | col_placed[$col] | box_placed[$box]),\n".
         "  .is_singleton(cell_singleton[$idx]), .is_illegal(cell_illegal[$idx]), .solved(cell_solved[$idx]) );\n";
   }
 }
+
+# peer mask network, a cell is always its own peer here, but a cell placing a digit ignores its mask
+for my $unit (['row',\@rowids],['col',\@colids],['box',\@boxids]) {
+  my ($name,$ids) = @$unit;
+  for (my $i = 0; $i < 9; ++$i) {
+    print "assign ${name}_placed[$i] = " . join(' | ', map { "cell_placed[$_]" } @{ $ids->[$i] }) . ";\n";
+  }
+}